@@ -1,5 +1,11 @@
 import tkinter as tk
 from tkinter import ttk
+import math
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from itertools import count
 
 
 def configure_style(window):
@@ -34,36 +40,426 @@ def configure_style(window):
 
 
 def get_polynomial_value(x, a=1, b=1, c=1, d=1, e=1, f=1):
-    return a * x ** 5 + b * x ** 4 + c * x ** 3 + d * x ** 2 + e * x + f
+    return ((((a * x + b) * x + c) * x + d) * x + e) * x + f
+
+
+def compile_polynomial(coefficients):
+    # Builds a function with the coefficients baked in as constants and the
+    # Horner steps unrolled, so evaluating it costs no loop or lookups.
+    coefficients = [float(coefficient) for coefficient in coefficients] or [0.0]
+    if not all(math.isfinite(coefficient) for coefficient in coefficients):
+        return lambda x: horner(coefficients, x)
+    lines = ["def polynomial(x):", f"    value = {coefficients[0]!r}"]
+    lines += [f"    value = value * x + {coefficient!r}" for coefficient in coefficients[1:]]
+    lines.append("    return value")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['polynomial']
+
+
+def cauchy_bound(coefficients):
+    # Every root satisfies |x| <= 1 + max |a_i / a_n|, a_n being the leading coefficient.
+    coefficients = strip_leading_zeros(coefficients)
+    if len(coefficients) < 2:
+        return 1.0
+    leading = abs(coefficients[0])
+    return 1.0 + max(abs(coefficient) for coefficient in coefficients[1:]) / leading
 
 
 def same_sign(n1, n2):
     return (n1 * n2) > 0
 
 
-def find_roots_bisection(a=1, b=1, c=1, d=1, e=1, f=1, min_val=-100, max_val=100,
-                         epsilon=0.00001, move=0.001):
+SCAN_CHUNK = 1 << 16
+
+
+def horner(coefficients, x):
+    value = 0
+    for coefficient in coefficients:
+        value = value * x + coefficient
+    return value
+
+
+def grid_brackets(coefficients, min_val, max_val, move):
+    # Yields (x, x + move, p(x), p(x + move)) for every grid cell over which
+    # the polynomial changes sign, and (x, x, 0, 0) for grid points that are
+    # exact roots, scanning SCAN_CHUNK grid points per pass to bound memory.
+    evaluate = compile_polynomial(coefficients)
+    steps = max(math.ceil((max_val - min_val) / move), 1)
+    for chunk_start in range(0, steps + 1, SCAN_CHUNK):
+        first = max(chunk_start - 1, 0)
+        points = [min_val + i * move for i in range(first, min(chunk_start + SCAN_CHUNK, steps + 1))]
+        values = list(map(evaluate, points))
+        if first == 0 and values[0] == 0:
+            yield points[0], points[0], 0.0, 0.0
+        for i in [i for i, (left, right) in enumerate(zip(values, values[1:])) if left * right <= 0]:
+            if values[i + 1] == 0:
+                yield points[i + 1], points[i + 1], 0.0, 0.0
+            elif values[i] != 0:
+                yield points[i], points[i + 1], values[i], values[i + 1]
+
+
+def bisect_bracket(evaluate, slope, left, right, left_value, right_value, epsilon):
+    mid = (left + right) / 2
+    while (right - left) > epsilon:
+        mid = (left + right) / 2
+        if mid == left or mid == right:
+            break
+        mid_value = evaluate(mid)
+        if same_sign(left_value, mid_value):
+            left, left_value = mid, mid_value
+        else:
+            right = mid
+    return mid
+
+
+def illinois_bracket(evaluate, slope, left, right, left_value, right_value, epsilon):
+    # False position, halving the value kept at an endpoint that is retained
+    # twice in a row so that neither end of the bracket stalls.
+    x = left
+    side = 0
+    while (right - left) > epsilon:
+        denominator = right_value - left_value
+        x = left - left_value * ((right - left) / denominator) if denominator else left
+        if not left < x < right:
+            x = left + (right - left) / 2
+            if x == left or x == right:
+                break
+        value = evaluate(x)
+        if value == 0:
+            return x
+        if same_sign(value, right_value):
+            right, right_value = x, value
+            if side == -1:
+                left_value /= 2
+            side = -1
+        else:
+            left, left_value = x, value
+            if side == 1:
+                right_value /= 2
+            side = 1
+    return x
+
+
+def brent_bracket(evaluate, slope, left, right, left_value, right_value, epsilon):
+    # Brent's method: inverse quadratic interpolation or secant steps while they
+    # make good progress, bisection otherwise; the root stays bracketed by
+    # [b, c] throughout.
+    a, b, c = left, right, right
+    fa, fb, fc = left_value, right_value, right_value
+    d = e = b - a
+    while True:
+        if same_sign(fb, fc):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tolerance = 2 * sys.float_info.epsilon * abs(b) + epsilon / 2
+        half_width = (c - b) / 2
+        if abs(half_width) <= tolerance or fb == 0:
+            return b
+        if abs(e) >= tolerance and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2 * half_width * s
+                q = 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * half_width * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * half_width * q - abs(tolerance * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = half_width
+        else:
+            d = e = half_width
+        a, fa = b, fb
+        b += d if abs(d) > tolerance else math.copysign(tolerance, half_width)
+        fb = evaluate(b)
+
+
+def newton_bracket(evaluate, slope, left, right, left_value, right_value, epsilon):
+    # Newton's method using the analytic derivative, falling back to bisection
+    # whenever a step would leave the bracket or fails to halve the step before.
+    if left_value > 0:
+        left, right = right, left
+    x = (left + right) / 2
+    step = previous_step = abs(right - left)
+    value = evaluate(x)
+    while True:
+        gradient = slope(x)
+        if gradient == 0 or not min(left, right) < x - value / gradient < max(left, right) or \
+                abs(2 * value) > abs(previous_step * gradient):
+            previous_step, step = step, (right - left) / 2
+            x = left + step
+        else:
+            previous_step, step = step, value / gradient
+            x -= step
+        if abs(step) <= max(epsilon / 2, 2 * sys.float_info.epsilon * abs(x)):
+            return x
+        value = evaluate(x)
+        if value == 0:
+            return x
+        if value < 0:
+            left = x
+        else:
+            right = x
+
+
+REFINERS = {
+    'bisection': bisect_bracket,
+    'illinois': illinois_bracket,
+    'brent': brent_bracket,
+    'newton': newton_bracket,
+}
+
+
+def refine_brackets(coefficients, brackets, epsilon, method):
+    # Brackets are (left, right, left_value, right_value). Scans that already
+    # evaluated the endpoints pass the values on; None means not yet known.
+    if method not in REFINERS:
+        raise ValueError(f"Unknown refinement method: {method}")
+    refine = REFINERS[method]
+    evaluate = compile_polynomial(coefficients)
+    slope = compile_polynomial(derivative(coefficients))
+    roots = []
+    for left, right, left_value, right_value in brackets:
+        if left == right:
+            roots.append(left)
+            continue
+        left_value = evaluate(left) if left_value is None else left_value
+        right_value = evaluate(right) if right_value is None else right_value
+        roots.append(refine(evaluate, slope, left, right, left_value, right_value, epsilon))
+    return roots
+
+
+def strip_leading_zeros(coefficients):
+    coefficients = list(coefficients)
+    while coefficients and coefficients[0] == 0:
+        coefficients.pop(0)
+    return coefficients
+
+
+def derivative(coefficients):
+    degree = len(coefficients) - 1
+    return [coefficient * (degree - i) for i, coefficient in enumerate(coefficients[:-1])]
+
+
+def integer_polynomial(coefficients):
+    # Positive multiple of a Fraction polynomial with integer coefficients.
+    scale = 1
+    for coefficient in coefficients:
+        scale = math.lcm(scale, coefficient.denominator)
+    return [int(coefficient * scale) for coefficient in coefficients]
+
+
+def primitive_part(coefficients):
+    content = 0
+    for coefficient in coefficients:
+        content = math.gcd(content, coefficient)
+    return [coefficient // content for coefficient in coefficients] if content > 1 else coefficients
+
+
+def pseudo_divide(dividend, divisor):
+    # Integer division of m * dividend by divisor for some positive integer m,
+    # so quotient and remainder keep the signs a rational division would give.
+    scale = abs(divisor[0])
+    sign = 1 if divisor[0] > 0 else -1
+    remainder = list(dividend)
+    quotient = []
+    while len(remainder) >= len(divisor):
+        factor = remainder[0] * sign
+        quotient = [coefficient * scale for coefficient in quotient] + [factor]
+        padded = divisor + [0] * (len(remainder) - len(divisor))
+        remainder = [scale * value - factor * other for value, other in zip(remainder, padded)][1:]
+    return quotient, strip_leading_zeros(remainder)
+
+
+def squarefree_part(coefficients):
+    # p / gcd(p, p') has the same roots as p, each with multiplicity one, so
+    # even-multiplicity roots become sign changes as well.
+    first, second = coefficients, primitive_part(derivative(coefficients))
+    while second:
+        first, second = second, primitive_part(pseudo_divide(first, second)[1])
+    return primitive_part(pseudo_divide(coefficients, first)[0])
+
+
+def sturm_sequence(coefficients):
+    sequence = [coefficients, primitive_part(derivative(coefficients))]
+    while len(sequence[-1]) > 1:
+        remainder = pseudo_divide(sequence[-2], sequence[-1])[1]
+        if not remainder:
+            break
+        sequence.append([-coefficient for coefficient in primitive_part(remainder)])
+    return sequence
+
+
+def scaled_value(coefficients, x):
+    # den ** degree * p(num / den) for x = num / den, in integer arithmetic; it
+    # has the sign of p(x) and avoids normalising a Fraction at every step.
+    numerator, denominator = x.numerator, x.denominator
+    value = 0
+    power = 1
+    for coefficient in coefficients:
+        value = value * numerator + coefficient * power
+        power *= denominator
+    return value
+
+
+def sign_variations(sequence, x):
+    signs = [value > 0 for value in (scaled_value(polynomial, x) for polynomial in sequence) if value]
+    return sum(left != right for left, right in zip(signs, signs[1:]))
+
+
+def isolate_roots(coefficients, min_val, max_val):
+    # Sturm's theorem: the number of distinct roots in (a, b] is V(a) - V(b),
+    # where V counts sign changes along the Sturm sequence. Intervals are split
+    # only while they hold more than one root, so the work follows the number
+    # of roots rather than the width of the search range. Returns exact roots
+    # found along the way as (x, x) and isolating intervals (a, b) otherwise.
+    polynomial = strip_leading_zeros(Fraction(coefficient) for coefficient in coefficients)
+    if len(polynomial) < 2:
+        return [], []
+    sequence = sturm_sequence(squarefree_part(integer_polynomial(polynomial)))
+    low, high = Fraction(min_val), Fraction(max_val)
+    intervals = [(low, low)] if scaled_value(sequence[0], low) == 0 else []
+    pending = [(low, high, sign_variations(sequence, low), sign_variations(sequence, high))]
+    while pending:
+        left, right, left_variations, right_variations = pending.pop()
+        root_count = left_variations - right_variations
+        if root_count <= 0:
+            continue
+        if root_count == 1:
+            if scaled_value(sequence[0], right) == 0:
+                intervals.append((right, right))
+                continue
+            # A root at low is already reported as (low, low); move the left
+            # end inside the interval, short of the root it still isolates.
+            step = (right - left) / 2
+            while scaled_value(sequence[0], left) == 0:
+                mid = left + step
+                if scaled_value(sequence[0], mid) != 0 and sign_variations(sequence, mid) == left_variations:
+                    left = mid
+                step /= 2
+            intervals.append((left, right))
+            continue
+        # Split points must not be roots themselves; only finitely many are.
+        for parts in count(2):
+            mid = left + (right - left) / parts
+            if scaled_value(sequence[0], mid) != 0:
+                break
+        mid_variations = sign_variations(sequence, mid)
+        pending.append((mid, right, mid_variations, right_variations))
+        pending.append((left, mid, left_variations, mid_variations))
+    return sequence[0], intervals
+
+
+def sturm_roots(coefficients, min_val, max_val, epsilon, method='bisection'):
+    polynomial, intervals = isolate_roots(coefficients, min_val, max_val)
+    # Isolation only knows exact signs, so the float endpoint values are left
+    # for refine_brackets to compute.
+    brackets = [(float(left), float(right), None, None) for left, right in intervals]
+    largest = max(map(abs, polynomial), default=1)
+    return refine_brackets([coefficient / largest for coefficient in polynomial], brackets, epsilon, method)
+
+
+def grid_roots(coefficients, min_val, max_val, epsilon, move, method='bisection'):
+    return refine_brackets(coefficients, grid_brackets(coefficients, min_val, max_val, move), epsilon, method)
+
+
+def step_scan_roots(coefficients, min_val, max_val, epsilon, move):
+    evaluate = compile_polynomial(coefficients)
     roots = []
     left = min_val
     while left < max_val:
-        if same_sign(get_polynomial_value(left, a, b, c, d, e, f), get_polynomial_value(left +
-                                                                                        move, a, b, c, d, e, f)):
+        if same_sign(evaluate(left), evaluate(left + move)):
             left += move
         else:
             left_bisection = left
             right_bisection = left + move
             while (right_bisection - left_bisection) > epsilon:
                 mid = (left_bisection + right_bisection) / 2
-                if same_sign(get_polynomial_value(left_bisection, a, b, c, d, e, f),
-                             get_polynomial_value(mid, a, b, c, d, e, f)):
+                if same_sign(evaluate(left_bisection), evaluate(mid)):
                     left_bisection = mid
                 else:
                     right_bisection = mid
-            roots.append(round(mid, len(str(epsilon)) - 2))
+            roots.append(mid)
             left = right_bisection
     return roots
 
 
+def find_roots(coefficients, min_val=None, max_val=None, epsilon=0.00001, move=0.001, scan='sturm',
+               method='bisection'):
+    # Coefficients run from the highest power down to the constant term; the
+    # search range defaults to Cauchy's bound on the roots.
+    coefficients = strip_leading_zeros(coefficients)
+    if len(coefficients) < 2:
+        return []
+    bound = cauchy_bound(coefficients)
+    min_val = -bound if min_val is None else min_val
+    max_val = bound if max_val is None else max_val
+    if not all(math.isfinite(value) for value in (min_val, max_val, *coefficients)):
+        raise ValueError("Coefficients and search range must be finite; give min_val and max_val explicitly "
+                         "when the leading coefficient is tiny.")
+    if min_val > max_val:
+        return []
+    if scan == 'sturm':
+        roots = sturm_roots(coefficients, min_val, max_val, epsilon, method)
+    elif scan == 'grid':
+        roots = grid_roots(coefficients, min_val, max_val, epsilon, move, method)
+    elif scan == 'step':
+        roots = step_scan_roots(coefficients, min_val, max_val, epsilon, move)
+    else:
+        raise ValueError(f"Unknown scan mode: {scan}")
+    return [round(root, len(str(epsilon)) - 2) for root in roots]
+
+
+BATCH_CHUNK = 1024
+
+
+def find_roots_chunk(task):
+    rows, min_val, max_val, epsilon, move, scan, method = task
+    values = array('d')
+    counts = array('q')
+    for coefficients in rows:
+        roots = find_roots(coefficients, min_val, max_val, epsilon, move, scan, method)
+        values.extend(roots)
+        counts.append(len(roots))
+    return values, counts
+
+
+def find_roots_batch(coefficient_rows, min_val=None, max_val=None, epsilon=0.00001, move=0.001, scan='sturm',
+                     method='bisection', workers=None, chunk_size=BATCH_CHUNK):
+    # Roots of many polynomials (one coefficient row each, e.g. an (N, degree + 1)
+    # array), solved in chunks across a process pool. The result is ragged:
+    # the roots of row i are values[offsets[i]:offsets[i + 1]].
+    if hasattr(coefficient_rows, 'tolist'):
+        coefficient_rows = coefficient_rows.tolist()
+    tasks = [(coefficient_rows[start:start + chunk_size], min_val, max_val, epsilon, move, scan, method)
+             for start in range(0, len(coefficient_rows), chunk_size)]
+    if workers == 1:
+        results = map(find_roots_chunk, tasks)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(find_roots_chunk, tasks))
+    values = array('d')
+    offsets = array('q', [0])
+    for chunk_values, counts in results:
+        values.extend(chunk_values)
+        for root_count in counts:
+            offsets.append(offsets[-1] + root_count)
+    return values, offsets
+
+
+def find_roots_bisection(a=1, b=1, c=1, d=1, e=1, f=1, min_val=-100, max_val=100,
+                         epsilon=0.00001, move=0.001, scan='sturm', method='bisection'):
+    return find_roots((a, b, c, d, e, f), min_val, max_val, epsilon, move, scan, method)
+
+
 class RoundedButton(tk.Canvas):
     def __init__(self, parent, text, command, width=120, height=40,
                  corner_radius=10, bg='#2D2D2D', fg='white', hover_bg='#3D3D3D',
@@ -1,5 +1,16 @@
 import tkinter as tk
 from tkinter import ttk
+import math
+import mmap
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 def configure_style():
@@ -39,7 +50,10 @@ def configure_style():
                     relief='flat')
 
 
-def sieve_of_eratosthenes(limit):
+SEGMENT_SIZE = 1 << 18
+
+
+def basic_sieve(limit):
     is_prime = [True] * (limit + 1)
     is_prime[0:2] = [False, False]
     for number in range(2, int(limit ** 0.5) + 1):
@@ -49,35 +63,436 @@ def sieve_of_eratosthenes(limit):
     return [index for index, prime in enumerate(is_prime) if prime]
 
 
+def odd_base_primes(high):
+    return basic_sieve(math.isqrt(max(high - 1, 0)))[1:]
+
+
+def odd_segments(low, high, segment_size=SEGMENT_SIZE, base_primes=None):
+    # Yields (start, flags) windows over the odd numbers in [low, high), where
+    # flags[i] is 1 when start + 2 * i is prime. Only the base primes up to
+    # sqrt(high) and a single window are ever held in memory.
+    if base_primes is None:
+        base_primes = odd_base_primes(high)
+    start = max(low, 3) | 1
+    while start < high:
+        size = min(segment_size, (high - start + 1) // 2)
+        end = start + 2 * size
+        flags = bytearray(b'\x01') * size
+        for prime in base_primes:
+            first = prime * prime
+            if first >= end:
+                break
+            if first < start:
+                first = (start + prime - 1) // prime * prime
+                if first % 2 == 0:
+                    first += prime
+            index = (first - start) // 2
+            if index < size:
+                flags[index::prime] = bytes((size - 1 - index) // prime + 1)
+        yield start, flags
+        start = end
+
+
+def prime_segments(low, high, segment_size=SEGMENT_SIZE, base_primes=None):
+    if low <= 2 < high:
+        yield [2]
+    for start, flags in odd_segments(low, high, segment_size, base_primes):
+        yield list(compress(range(start, start + 2 * len(flags), 2), flags))
+
+
+def iter_primes(low, high, segment_size=SEGMENT_SIZE):
+    for chunk in prime_segments(low, high, segment_size):
+        yield from chunk
+
+
+def segmented_sieve(limit, segment_size=SEGMENT_SIZE):
+    return list(iter_primes(2, limit + 1, segment_size))
+
+
+WHEEL = 30
+WHEEL_RESIDUES = (1, 7, 11, 13, 17, 19, 23, 29)
+
+
+def wheel_sieve(limit):
+    # Mod-30 wheel: only numbers coprime to 2, 3 and 5 are stored, one
+    # bytearray per residue class where index k stands for 30 * k + residue.
+    # Multiples of a prime p within a class are p indices apart, so every
+    # (prime, class) pair is crossed off with a single slice assignment.
+    if limit < 7:
+        return [prime for prime in (2, 3, 5) if prime <= limit]
+    size = limit // WHEEL + 1
+    classes = {residue: bytearray(b'\x01') * size for residue in WHEEL_RESIDUES}
+    classes[1][0] = 0
+    for prime in basic_sieve(math.isqrt(limit))[3:]:
+        inverse = pow(prime, -1, WHEEL)
+        for residue, flags in classes.items():
+            factor = residue * inverse % WHEEL
+            factor += (prime - factor + WHEEL - 1) // WHEEL * WHEEL
+            index = prime * factor // WHEEL
+            if index < size:
+                flags[index::prime] = bytes((size - 1 - index) // prime + 1)
+    merged = bytearray(len(WHEEL_RESIDUES) * size)
+    for position, residue in enumerate(WHEEL_RESIDUES):
+        merged[position::len(WHEEL_RESIDUES)] = classes[residue]
+    primes = [2, 3, 5]
+    primes.extend(WHEEL * (index >> 3) + WHEEL_RESIDUES[index & 7]
+                  for index in compress(range(len(merged)), merged))
+    while primes[-1] > limit:
+        primes.pop()
+    return primes
+
+
+BLOCK_SIZE = 1 << 24
+worker_base_primes = None
+
+
+def init_sieve_worker(base_primes):
+    global worker_base_primes
+    worker_base_primes = base_primes
+
+
+def count_primes_in_range(low, high, segment_size=SEGMENT_SIZE, base_primes=None):
+    count = 1 if low <= 2 < high else 0
+    for start, flags in odd_segments(low, high, segment_size, base_primes):
+        count += flags.count(1)
+    return count
+
+
+def sieve_block(block):
+    low, high, segment_size, count_only = block
+    if count_only:
+        return count_primes_in_range(low, high, segment_size, worker_base_primes)
+    return [prime for chunk in prime_segments(low, high, segment_size, worker_base_primes) for prime in chunk]
+
+
+def parallel_sieve(low, high, workers=None, count_only=False, segment_size=SEGMENT_SIZE, block_size=BLOCK_SIZE):
+    # Yields one result per block of [low, high) in ascending order: the list of
+    # primes in the block, or only their number when count_only is set.
+    workers = workers or os.cpu_count()
+    block_size = max(2 * segment_size, min(block_size, -(-(high - low) // (4 * workers))))
+    blocks = [(start, min(start + block_size, high), segment_size, count_only)
+              for start in range(low, high, block_size)]
+    with ProcessPoolExecutor(workers, initializer=init_sieve_worker,
+                             initargs=(odd_base_primes(high),)) as pool:
+        yield from pool.map(sieve_block, blocks)
+
+
+def count_primes(limit, workers=1, segment_size=SEGMENT_SIZE):
+    if workers == 1:
+        return count_primes_in_range(2, limit + 1, segment_size)
+    return sum(parallel_sieve(2, limit + 1, workers, True, segment_size))
+
+
+def prime_pi(n):
+    # Lucy_Hedgehog's method: small[v] and large[i] hold the number of
+    # integers in [2, v] and [2, n // i] that survive sieving by the primes
+    # processed so far, so only O(sqrt(n)) values are ever tracked.
+    if n < 2:
+        return 0
+    root = math.isqrt(n)
+    small = [max(value - 1, 0) for value in range(root + 1)]
+    large = [0] + [n // i - 1 for i in range(1, root + 1)]
+    for prime in range(2, root + 1):
+        if small[prime] == small[prime - 1]:
+            continue
+        count = small[prime - 1]
+        square = prime * prime
+        limit = min(root, n // square)
+        direct = min(limit, root // prime)
+        large[1:direct + 1] = [large[i] - large[i * prime] + count for i in range(1, direct + 1)]
+        large[direct + 1:limit + 1] = [large[i] - small[n // (i * prime)] + count
+                                       for i in range(direct + 1, limit + 1)]
+        if square <= root:
+            small[square:] = [small[value] - small[value // prime] + count for value in range(square, root + 1)]
+    return large[1]
+
+
+def nth_prime(k):
+    if k < 1:
+        raise ValueError("k must be a positive integer")
+    if k < 6:
+        return (2, 3, 5, 7, 11)[k - 1]
+    log_k = math.log(k)
+    log_log_k = math.log(log_k)
+    upper_bound = int(k * (log_k + log_log_k)) + 1
+    estimate = int(k * (log_k + log_log_k - 1 + (log_log_k - 2) / log_k))
+    count = prime_pi(estimate)
+    while count >= k:
+        low = max(estimate - SEGMENT_SIZE, 1)
+        count -= count_primes_in_range(low + 1, estimate + 1)
+        estimate = low
+    for prime in iter_primes(estimate + 1, upper_bound + 1):
+        count += 1
+        if count == k:
+            return prime
+
+
+TABLE_HEADER = struct.Struct('<8sQ')
+TABLE_MAGIC = b'PRIMETBL'
+BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def pack_flags(flags):
+    # Packs 0/1 flags (a multiple of eight of them) into bytes, flag i being bit i.
+    if not flags:
+        return b''
+    return int(flags[::-1].translate(BIT_DIGITS), 2).to_bytes(len(flags) // 8, 'little')
+
+
+class PrimeTable:
+    # On-disk bitset of primality for the odd numbers: bit n // 2 of the data
+    # that follows the header is set when the odd number n is prime, and each
+    # byte covers 16 consecutive integers. The file is mapped read-only, so any
+    # number of processes can share one table; extend() appends new bytes and
+    # rewrites the header last under an exclusive lock, and readers take a
+    # shared lock to pick that up on their next miss.
+    def __init__(self, path, limit=0):
+        self.path = path
+        self.map = None
+        self.limit = -1
+        self.refresh()
+        if limit > self.limit:
+            self.extend(limit)
+
+    def refresh(self):
+        self.close()
+        try:
+            descriptor = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        with os.fdopen(descriptor, 'rb') as table_file:
+            if fcntl is not None:
+                fcntl.flock(table_file, fcntl.LOCK_SH)
+            limit = self.header_limit(table_file.read(TABLE_HEADER.size))
+            if limit >= 0:
+                self.map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.limit = limit
+            # The map shares this descriptor's lock, so release it explicitly
+            # or it would block every extend() for as long as the map is open.
+            if fcntl is not None:
+                fcntl.flock(table_file, fcntl.LOCK_UN)
+
+    def header_limit(self, header):
+        # An empty file or an all-zero header is a table that another process
+        # has created but not finished writing yet, so it covers nothing.
+        if not any(header):
+            return -1
+        if len(header) < TABLE_HEADER.size or header[:len(TABLE_MAGIC)] != TABLE_MAGIC:
+            raise ValueError(f"{self.path} is not a prime table")
+        return TABLE_HEADER.unpack(header)[1]
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.limit = -1
+
+    def extend(self, limit, segment_size=SEGMENT_SIZE):
+        segment_size = max(segment_size - segment_size % 8, 8)
+        self.close()
+        # Creating with O_CREAT never truncates, so concurrent first-time
+        # extenders all open the same file and then queue on the lock.
+        descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with os.fdopen(descriptor, 'r+b') as table_file:
+            if fcntl is not None:
+                fcntl.flock(table_file, fcntl.LOCK_EX)
+            covered = self.header_limit(table_file.read(TABLE_HEADER.size))
+            if limit > covered:
+                table_file.seek(TABLE_HEADER.size + (covered + 1) // 16)
+                start = covered + 1
+                if start == 0:
+                    table_file.write(pack_flags(b'\x00' + next(odd_segments(3, 16))[1]))
+                    start = 16
+                end = -(-(limit + 1) // 16) * 16
+                for segment_start, flags in odd_segments(start, end, segment_size):
+                    table_file.write(pack_flags(flags))
+                table_file.flush()
+                table_file.seek(0)
+                table_file.write(TABLE_HEADER.pack(TABLE_MAGIC, end - 1))
+        self.refresh()
+
+    def covers(self, n):
+        if n > self.limit:
+            self.refresh()
+        return n <= self.limit
+
+    def is_prime(self, n):
+        if not self.covers(n):
+            raise ValueError(f"{n} is beyond the table limit {self.limit}")
+        if n < 3 or n % 2 == 0:
+            return n == 2
+        index = n // 2
+        return bool(self.map[TABLE_HEADER.size + (index >> 3)] >> (index & 7) & 1)
+
+    def primes_in_range(self, low, high):
+        if not self.covers(high - 1):
+            raise ValueError(f"{high - 1} is beyond the table limit {self.limit}")
+        if low <= 2 < high:
+            yield 2
+        low = max(low, 3)
+        for position in range(low // 16, -(-high // 16)):
+            base = 16 * position + 1
+            for bit in BYTE_BITS[self.map[TABLE_HEADER.size + position]]:
+                number = base + 2 * bit
+                if low <= number < high:
+                    yield number
+
+    def count_in_range(self, low, high):
+        if not self.covers(high - 1):
+            raise ValueError(f"{high - 1} is beyond the table limit {self.limit}")
+        count = 1 if low <= 2 < high else 0
+        low = max(low, 3)
+        first = -(-low // 16)
+        last = max(high // 16, first)
+        data = self.map[TABLE_HEADER.size + first:TABLE_HEADER.size + last]
+        count += bin(int.from_bytes(data, 'little')).count('1')
+        count += sum(1 for _ in self.primes_in_range(low, min(high, 16 * first)))
+        count += sum(1 for _ in self.primes_in_range(max(low, 16 * last), high))
+        return count
+
+
+TRIAL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+# Jim Sinclair's bases are deterministic for every n < 2 ** 64. Larger n get
+# the Baillie-PSW test: a strong probable-prime test to base 2 followed by a
+# strong Lucas test, which has no known counterexample.
+MILLER_RABIN_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+
+def is_prime(n, table=None):
+    if table is not None and n <= table.limit:
+        return table.is_prime(n)
+    if n < 2:
+        return False
+    for prime in TRIAL_PRIMES:
+        if n % prime == 0:
+            return n == prime
+    if n < 10000:
+        return True
+    if n >= 1 << 64:
+        return is_strong_probable_prime(n, 2) and is_strong_lucas_probable_prime(n)
+    return all(is_strong_probable_prime(n, base) for base in MILLER_RABIN_BASES_64)
+
+
+def is_strong_probable_prime(n, base):
+    # One Miller-Rabin round for an odd n > 2.
+    base %= n
+    if base == 0:
+        return True
+    odd_part = n - 1
+    shift = (odd_part & -odd_part).bit_length() - 1
+    odd_part >>= shift
+    x = pow(base, odd_part, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(shift - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def jacobi_symbol(a, n):
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def is_strong_lucas_probable_prime(n):
+    # Strong Lucas test for an odd n > 2 with Selfridge's parameters: the first
+    # D in 5, -7, 9, -11, ... with (D / n) = -1, P = 1 and Q = (1 - D) / 4.
+    root = math.isqrt(n)
+    if root * root == n:
+        return False
+    d = 5
+    while True:
+        symbol = jacobi_symbol(d, n)
+        if symbol == -1:
+            break
+        if symbol == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    q = (1 - d) // 4
+    odd_part = n + 1
+    shift = (odd_part & -odd_part).bit_length() - 1
+    odd_part >>= shift
+    # Binary ladder for U_k, V_k and Q^k over the bits of odd_part, with P = 1.
+    u, v, q_power = 1, 1, q % n
+    for bit in bin(odd_part)[3:]:
+        u, v = u * v % n, (v * v - 2 * q_power) % n
+        q_power = q_power * q_power % n
+        if bit == '1':
+            u, v = u + v, d * u + v
+            u = (u + n if u % 2 else u) // 2 % n
+            v = (v + n if v % 2 else v) // 2 % n
+            q_power = q_power * q % n
+    if u == 0 or v == 0:
+        return True
+    for _ in range(shift - 1):
+        v = (v * v - 2 * q_power) % n
+        if v == 0:
+            return True
+        q_power = q_power * q_power % n
+    return False
+
+
+def is_prime_many(values, table=None):
+    return [is_prime(value, table) for value in values]
+
+
+def sieve_of_eratosthenes(limit, method='segmented', segment_size=SEGMENT_SIZE, workers=1):
+    if method == 'segmented':
+        if workers != 1:
+            return [prime for block in parallel_sieve(2, limit + 1, workers, False, segment_size) for prime in block]
+        return segmented_sieve(limit, segment_size)
+    if method == 'wheel':
+        return wheel_sieve(limit)
+    if method == 'basic':
+        return basic_sieve(limit)
+    raise ValueError(f"Unknown sieve method: {method}")
+
+
+GUI_CHUNK_SIZE = 4096
+prime_stream = None
+
+
 def on_find_primes():
+    global prime_stream
     try:
         limit = int(limit_entry.get())
-        primes = sieve_of_eratosthenes(limit)
-        result_text.delete("1.0", tk.END)
-        result_text.insert(tk.END, f"Prime numbers to {limit}:\n" + ", ".join(map(str, primes)))
     except ValueError:
+        prime_stream = None
         result_text.delete("1.0", tk.END)
         result_text.insert(tk.END, "Invalid data. Please enter an integer.")
+        return
+    result_text.delete("1.0", tk.END)
+    result_text.insert(tk.END, f"Prime numbers to {limit}:\n")
+    prime_stream = prime_segments(2, limit + 1, GUI_CHUNK_SIZE)
+    insert_prime_chunk(prime_stream, "")
+
+
+def insert_prime_chunk(stream, separator):
+    # A newer search replaces prime_stream, which stops this one.
+    if stream is not prime_stream:
+        return
+    chunk = next(stream, None)
+    if chunk is None:
+        return
+    if chunk:
+        result_text.insert(tk.END, separator + ", ".join(map(str, chunk)))
+        separator = ", "
+    window.after(1, insert_prime_chunk, stream, separator)
 
 
-window = tk.Tk()
-window.title("Sieve of Eratosthenes")
-window.geometry("600x500")
-configure_style()
-
-main_frame = ttk.Frame(window)
-main_frame.pack(padx=20, pady=20, fill=tk.BOTH, expand=True)
-
-header_label = ttk.Label(main_frame, text="Sieve of Eratosthenes", style='Header.TLabel')
-header_label.pack(pady=(0, 15))
-
-input_frame = ttk.Frame(main_frame)
-input_frame.pack(fill=tk.X, pady=5)
-
-ttk.Label(input_frame, text="Upper limit:").pack(pady=(5, 2), anchor='w')
-limit_entry = ttk.Entry(input_frame)
-limit_entry.pack(pady=5, fill='x')
-
 class RoundedButton(tk.Canvas):
     def __init__(self, parent, text, command, width=120, height=40,
                  corner_radius=10, bg='#2D2D2D', fg='white', hover_bg='#3D3D3D',
@@ -136,41 +551,59 @@ class RoundedButton(tk.Canvas):
             self.command()
 
 
-button_frame = tk.Frame(main_frame, bg='#121212')
-button_frame.pack(fill=tk.X, pady=10)
-
-find_primes_button = RoundedButton(
-    button_frame,
-    text="Find Prime Numbers",
-    command=on_find_primes,
-    width=250,
-    height=36,
-    corner_radius=18,
-    bg='#2D2D2D',
-    hover_bg='#3D3D3D'
-)
-find_primes_button.pack(pady=5)
-
-result_frame = ttk.Frame(main_frame)
-result_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-
-result_text = tk.Text(
-    result_frame,
-    wrap='word',
-    bg='#252526',
-    fg='#FFFFFF',
-    insertbackground='white',
-    font=('Consolas', 10),
-    relief='flat',
-    borderwidth=0,
-    highlightthickness=0
-)
-result_text.pack(fill='both', expand=True)
-
-
-window.update()
-for widget in window.winfo_children():
-    if isinstance(widget, ttk.Frame):
-        widget.configure(style='TFrame')
-
-window.mainloop()
+if __name__ == "__main__":
+    window = tk.Tk()
+    window.title("Sieve of Eratosthenes")
+    window.geometry("600x500")
+    configure_style()
+
+    main_frame = ttk.Frame(window)
+    main_frame.pack(padx=20, pady=20, fill=tk.BOTH, expand=True)
+
+    header_label = ttk.Label(main_frame, text="Sieve of Eratosthenes", style='Header.TLabel')
+    header_label.pack(pady=(0, 15))
+
+    input_frame = ttk.Frame(main_frame)
+    input_frame.pack(fill=tk.X, pady=5)
+
+    ttk.Label(input_frame, text="Upper limit:").pack(pady=(5, 2), anchor='w')
+    limit_entry = ttk.Entry(input_frame)
+    limit_entry.pack(pady=5, fill='x')
+
+    button_frame = tk.Frame(main_frame, bg='#121212')
+    button_frame.pack(fill=tk.X, pady=10)
+
+    find_primes_button = RoundedButton(
+        button_frame,
+        text="Find Prime Numbers",
+        command=on_find_primes,
+        width=250,
+        height=36,
+        corner_radius=18,
+        bg='#2D2D2D',
+        hover_bg='#3D3D3D'
+    )
+    find_primes_button.pack(pady=5)
+
+    result_frame = ttk.Frame(main_frame)
+    result_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+
+    result_text = tk.Text(
+        result_frame,
+        wrap='word',
+        bg='#252526',
+        fg='#FFFFFF',
+        insertbackground='white',
+        font=('Consolas', 10),
+        relief='flat',
+        borderwidth=0,
+        highlightthickness=0
+    )
+    result_text.pack(fill='both', expand=True)
+
+    window.update()
+    for widget in window.winfo_children():
+        if isinstance(widget, ttk.Frame):
+            widget.configure(style='TFrame')
+
+    window.mainloop()
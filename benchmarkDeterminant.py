@@ -0,0 +1,40 @@
+import os
+import random
+import sys
+import time
+
+from determinantMatrix import blocked_lu_pivots, log_determinant
+
+
+def random_matrix_values(n, seed=0):
+    generator = random.Random(seed)
+    return [generator.uniform(-1, 1) for _ in range(n * n)]
+
+
+def worker_counts(max_workers):
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def run_benchmark(sizes, max_workers):
+    print(f"{'n':>6} {'workers':>8} {'seconds':>10} {'speedup':>8}  log|det|")
+    for n in sizes:
+        values = random_matrix_values(n)
+        baseline = None
+        for workers in worker_counts(max_workers):
+            start = time.perf_counter()
+            sign, log_abs_det = log_determinant(*blocked_lu_pivots(values, n, workers))
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{n:>6} {workers:>8} {elapsed:>10.2f} {baseline / elapsed:>8.2f}  {sign:+.0f} {log_abs_det:.6f}")
+
+
+if __name__ == "__main__":
+    # Usage: python benchmarkDeterminant.py [n ...], e.g. 2000 4000 8000.
+    matrix_sizes = [int(arg) for arg in sys.argv[1:]] or [500, 1000]
+    run_benchmark(matrix_sizes, os.cpu_count())
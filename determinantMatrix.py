@@ -1,5 +1,15 @@
 import tkinter as tk
 from tkinter import ttk
+import ast
+import heapq
+import math
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from multiprocessing.shared_memory import SharedMemory
 
 
 def configure_style(window):
@@ -58,7 +68,506 @@ def configure_style(window):
               foreground=[('active', text_color), ('pressed', text_color)])
 
 
-def calculate_determinant(matrix):
+def calculate_determinant(matrix, method='auto'):
+    if method == 'auto':
+        return structured_determinant(matrix)
+    if method == 'lu':
+        return lu_determinant(flatten_matrix(matrix), len(matrix))
+    if method == 'blocked':
+        return blocked_lu_determinant(flatten_matrix(matrix), len(matrix))
+    if method == 'bareiss':
+        return bareiss_determinant(matrix)
+    if method == 'modular':
+        return modular_determinant(matrix)
+    if method == 'laplace':
+        return laplace_determinant(matrix)
+    raise ValueError(f"Unknown determinant method: {method}")
+
+
+def flatten_matrix(matrix):
+    n = len(matrix)
+    values = []
+    for row in matrix:
+        if len(row) != n:
+            raise ValueError("The matrix must be square.")
+        values.extend(row)
+    return values
+
+
+def lu_determinant(values, n):
+    sign, pivots = lu_pivots(values, n)
+    return sign * math.prod(pivots)
+
+
+def lu_pivots(values, n):
+    # Gaussian elimination with partial pivoting on one row-major working copy
+    # of the matrix. Returns the sign of the row permutation (0 when the matrix
+    # is singular) and the pivots, whose signed product is the determinant.
+    buffer = list(values)
+    size = n * n
+    sign = 1
+    pivots = []
+    for k in range(n):
+        base = k * n
+        pivot_index = max(range(base + k, size, n), key=lambda index: abs(buffer[index]))
+        pivot = buffer[pivot_index]
+        if pivot == 0:
+            return 0, [0.0]
+        other = pivot_index - k
+        if other != base:
+            pivot_row = buffer[other + k:other + n]
+            buffer[other + k:other + n] = buffer[base + k:base + n]
+            buffer[base + k:base + n] = pivot_row
+            sign = -sign
+        pivots.append(pivot)
+        pivot_row = buffer[base + k + 1:base + n]
+        for start in range(base + n, size, n):
+            factor = buffer[start + k]
+            if factor:
+                factor /= pivot
+                buffer[start + k + 1:start + n] = [value - factor * pivot_value for value, pivot_value
+                                                   in zip(buffer[start + k + 1:start + n], pivot_row)]
+    return sign, pivots
+
+
+LU_BLOCK_SIZE = 64
+worker_memory = None
+
+
+def blocked_lu_determinant(values, n, workers=None, block_size=LU_BLOCK_SIZE):
+    sign, pivots = blocked_lu_pivots(values, n, workers, block_size)
+    return sign * math.prod(pivots)
+
+
+def blocked_lu_pivots(values, n, workers=None, block_size=LU_BLOCK_SIZE):
+    # Right-looking blocked LU on a shared-memory buffer: each panel of
+    # block_size columns is factorised here, then the trailing submatrix update
+    # is split into row ranges that worker processes apply in place.
+    memory = SharedMemory(create=True, size=max(n * n, 1) * 8)
+    matrix = memory.buf.cast('d')
+    try:
+        matrix[:n * n] = array('d', values)
+        if workers == 1:
+            return factor_blocks(matrix, n, block_size, None, 1)
+        workers = workers or os.cpu_count()
+        with ProcessPoolExecutor(workers, initializer=init_lu_worker, initargs=(memory.name,)) as pool:
+            return factor_blocks(matrix, n, block_size, pool, workers)
+    finally:
+        matrix.release()
+        memory.close()
+        memory.unlink()
+
+
+def factor_blocks(matrix, n, block_size, pool, workers):
+    sign = 1
+    pivots = []
+    for k in range(0, n, block_size):
+        end = min(k + block_size, n)
+        for j in range(k, end):
+            pivot_row = max(range(j, n), key=lambda i: abs(matrix[i * n + j]))
+            pivot = matrix[pivot_row * n + j]
+            if pivot == 0:
+                return 0, [0.0]
+            if pivot_row != j:
+                row = matrix[j * n:(j + 1) * n].tolist()
+                matrix[j * n:(j + 1) * n] = matrix[pivot_row * n:(pivot_row + 1) * n]
+                matrix[pivot_row * n:(pivot_row + 1) * n] = array('d', row)
+                sign = -sign
+            pivots.append(pivot)
+            panel_tail = matrix[j * n + j + 1:j * n + end].tolist()
+            for start in range((j + 1) * n, n * n, n):
+                factor = matrix[start + j] / pivot
+                matrix[start + j] = factor
+                if factor and panel_tail:
+                    matrix[start + j + 1:start + end] = array('d', [
+                        value - factor * upper
+                        for value, upper in zip(matrix[start + j + 1:start + end].tolist(), panel_tail)])
+        if end == n:
+            break
+        for j in range(k + 1, end):
+            update_rows(matrix, n, k, j, end, j, j + 1)
+        if pool is None:
+            update_rows(matrix, n, k, end, end, end, n)
+        else:
+            step = -(-(n - end) // workers)
+            tasks = [(n, k, end, first, min(first + step, n)) for first in range(end, n, step)]
+            list(pool.map(update_trailing_rows, tasks))
+    return sign, pivots
+
+
+def update_rows(matrix, n, first_pivot, last_pivot, column, first_row, last_row):
+    # Subtracts L[i, first_pivot:last_pivot] @ U[first_pivot:last_pivot, column:]
+    # from every row i in [first_row, last_row).
+    upper_rows = [matrix[t * n + column:(t + 1) * n].tolist() for t in range(first_pivot, last_pivot)]
+    for start in range(first_row * n, last_row * n, n):
+        row = matrix[start + column:start + n].tolist()
+        for factor, upper_row in zip(matrix[start + first_pivot:start + last_pivot].tolist(), upper_rows):
+            if factor:
+                row = [value - factor * upper for value, upper in zip(row, upper_row)]
+        matrix[start + column:start + n] = array('d', row)
+
+
+def init_lu_worker(name):
+    global worker_memory
+    worker_memory = SharedMemory(name=name)
+
+
+def update_trailing_rows(task):
+    n, k, end, first_row, last_row = task
+    matrix = worker_memory.buf.cast('d')
+    try:
+        update_rows(matrix, n, k, end, end, first_row, last_row)
+    finally:
+        matrix.release()
+
+
+def slogdet(matrix):
+    return log_determinant(*lu_pivots(flatten_matrix(matrix), len(matrix)))
+
+
+def sparse_slogdet(entries, n):
+    return log_determinant(*sparse_pivots(entries, n))
+
+
+def log_determinant(sign, pivots):
+    # Returns (sign, log|det|) from the pivots without forming their product,
+    # so the result neither overflows nor underflows.
+    if sign == 0:
+        return 0.0, -math.inf
+    log_abs_det = 0.0
+    for pivot in pivots:
+        if pivot < 0:
+            sign = -sign
+        log_abs_det += math.log(abs(pivot))
+    return float(sign), log_abs_det
+
+
+SPARSE_DENSITY = 0.1
+SPARSE_MIN_SIZE = 64
+SPARSE_PIVOT_THRESHOLD = 0.1
+
+
+def structured_determinant(matrix):
+    # Picks the cheapest algorithm for the matrix: the diagonal product for
+    # triangular matrices, a product over diagonal blocks, sparse LU for
+    # mostly-zero matrices and dense LU otherwise.
+    n = len(matrix)
+    last_column = []
+    nonzeros = 0
+    for row in matrix:
+        if len(row) != n:
+            raise ValueError("The matrix must be square.")
+        columns = [j for j, value in enumerate(row) if value]
+        last_column.append(columns[-1] if columns else -1)
+        nonzeros += len(columns)
+    if all(last <= i for i, last in enumerate(last_column)) or \
+            all(not any(row[:i]) for i, row in enumerate(matrix)):
+        return math.prod(matrix[i][i] for i in range(n))
+    blocks = diagonal_blocks(matrix, last_column)
+    if len(blocks) > 1:
+        return math.prod(calculate_determinant([row[start:end] for row in matrix[start:end]])
+                         for start, end in blocks)
+    if n >= SPARSE_MIN_SIZE and nonzeros <= SPARSE_DENSITY * n * n:
+        entries = {(i, j): value for i, row in enumerate(matrix) for j, value in enumerate(row) if value}
+        return sparse_determinant(entries, n)
+    return lu_determinant(flatten_matrix(matrix), n)
+
+
+def diagonal_blocks(matrix, last_column):
+    # A block can end after index k when no row up to k reaches past column k
+    # and no column up to k has an entry below row k.
+    last_row = [-1] * len(matrix)
+    for i, row in enumerate(matrix):
+        for j, value in enumerate(row):
+            if value:
+                last_row[j] = i
+    blocks = []
+    start = 0
+    reach = -1
+    for k in range(len(matrix)):
+        reach = max(reach, last_column[k], last_row[k])
+        if reach <= k:
+            blocks.append((start, k + 1))
+            start = k + 1
+    return blocks
+
+
+def sparse_determinant(entries, n):
+    sign, pivots = sparse_pivots(entries, n)
+    return sign * math.prod(pivots)
+
+
+def sparse_pivots(entries, n):
+    # Sparse LU on dict-of-keys input {(i, j): value}. Each step pivots in the
+    # remaining column with the fewest entries, on the shortest row whose value
+    # passes a threshold test (Markowitz-style), which keeps fill-in low for
+    # banded and other sparse structures.
+    rows = [{} for _ in range(n)]
+    columns = [set() for _ in range(n)]
+    for (i, j), value in entries.items():
+        if value:
+            rows[i][j] = value
+            columns[j].add(i)
+    queue = [(len(rows_in_column), j) for j, rows_in_column in enumerate(columns)]
+    heapq.heapify(queue)
+    eliminated = [False] * n
+    permutation = [0] * n
+    pivots = []
+    for _ in range(n):
+        count, j = heapq.heappop(queue)
+        while eliminated[j] or count != len(columns[j]):
+            count, j = heapq.heappop(queue)
+        if count == 0:
+            return 0, [0.0]
+        largest = max(abs(rows[i][j]) for i in columns[j])
+        i = min((i for i in columns[j] if abs(rows[i][j]) >= SPARSE_PIVOT_THRESHOLD * largest),
+                key=lambda i: len(rows[i]))
+        pivot_row = rows[i]
+        pivot = pivot_row.pop(j)
+        pivots.append(pivot)
+        permutation[i] = j
+        eliminated[j] = True
+        for column in pivot_row:
+            columns[column].discard(i)
+        columns[j].discard(i)
+        for other in columns[j]:
+            row = rows[other]
+            factor = row.pop(j) / pivot
+            for column, value in pivot_row.items():
+                updated = row.get(column, 0.0) - factor * value
+                if updated:
+                    row[column] = updated
+                    columns[column].add(other)
+                else:
+                    row.pop(column, None)
+                    columns[column].discard(other)
+        columns[j] = set()
+        for column in pivot_row:
+            heapq.heappush(queue, (len(columns[column]), column))
+        rows[i] = {}
+    return permutation_sign(permutation), pivots
+
+
+def permutation_sign(permutation):
+    sign = 1
+    seen = [False] * len(permutation)
+    for start in range(len(permutation)):
+        length = 0
+        index = start
+        while not seen[index]:
+            seen[index] = True
+            index = permutation[index]
+            length += 1
+        if length and length % 2 == 0:
+            sign = -sign
+    return sign
+
+
+BATCH_PIVOT_THRESHOLD = 0.1
+
+
+def calculate_determinants(stack, n=None):
+    # Determinants of a stack of equally sized matrices, given as a sequence of
+    # n x n matrices or, with n, as a flat row-major buffer of N * n * n values.
+    # Entry (i, j) of every matrix is kept together in one list, so each step of
+    # the elimination runs across the whole batch instead of once per matrix.
+    if hasattr(stack, 'tolist'):
+        stack = stack.tolist()
+    if n is None:
+        if not stack:
+            return []
+        n = len(stack[0])
+        for matrix in stack:
+            if len(matrix) != n or any(len(row) != n for row in matrix):
+                raise ValueError("Every matrix in the stack must be n x n.")
+        entries = [[[float(matrix[i][j]) for matrix in stack] for j in range(n)] for i in range(n)]
+    else:
+        if n < 1 or len(stack) % (n * n):
+            raise ValueError("The buffer length must be a multiple of n * n.")
+        entries = [[[float(value) for value in stack[i * n + j::n * n]] for j in range(n)] for i in range(n)]
+    count = len(entries[0][0])
+    dets = [1.0] * count
+    for k in range(n):
+        diagonal = list(map(abs, entries[k][k]))
+        largest = diagonal
+        pivots = [k] * count
+        for i in range(k + 1, n):
+            magnitudes = list(map(abs, entries[i][k]))
+            pivots = [i if magnitude > best else pivot
+                      for magnitude, best, pivot in zip(magnitudes, largest, pivots)]
+            largest = list(map(max, magnitudes, largest))
+        # Threshold pivoting: rows are only exchanged when the diagonal entry is
+        # much smaller than the column maximum, which keeps swaps rare.
+        pivots = [k if value >= BATCH_PIVOT_THRESHOLD * best else pivot
+                  for value, best, pivot in zip(diagonal, largest, pivots)]
+        pivot_row = entries[k]
+        for b, pivot in enumerate(pivots):
+            if pivot != k:
+                lower = entries[pivot]
+                for j in range(k, n):
+                    pivot_row[j][b], lower[j][b] = lower[j][b], pivot_row[j][b]
+                dets[b] = -dets[b]
+        diagonal = pivot_row[k]
+        dets = [det * value for det, value in zip(dets, diagonal)]
+        divisors = [value or 1.0 for value in diagonal]
+        for row in entries[k + 1:]:
+            factors = [value / divisor for value, divisor in zip(row[k], divisors)]
+            for j in range(k + 1, n):
+                row[j] = [value - factor * pivot_value
+                          for value, factor, pivot_value in zip(row[j], factors, pivot_row[j])]
+    return dets
+
+
+def integer_rows(matrix):
+    # Scales every row of an int/Fraction/float matrix to integers; returns the
+    # integer rows and the product of the scale factors used.
+    n = len(matrix)
+    rows = []
+    scale = 1
+    for row in matrix:
+        if len(row) != n:
+            raise ValueError("The matrix must be square.")
+        row = [value if isinstance(value, int) else Fraction(value) for value in row]
+        multiplier = 1
+        for value in row:
+            if isinstance(value, Fraction):
+                multiplier = math.lcm(multiplier, value.denominator)
+        rows.append([int(value * multiplier) for value in row])
+        scale *= multiplier
+    return rows, scale
+
+
+def bareiss_determinant(matrix):
+    # Fraction-free elimination: every division by the previous pivot is exact,
+    # so entries stay integers bounded by the size of the minors they represent.
+    rows, scale = integer_rows(matrix)
+    n = len(rows)
+    if n == 0:
+        return 1
+    sign = 1
+    previous = 1
+    for k in range(n - 1):
+        if rows[k][k] == 0:
+            swap = next((i for i in range(k + 1, n) if rows[i][k]), None)
+            if swap is None:
+                return 0
+            rows[k], rows[swap] = rows[swap], rows[k]
+            sign = -sign
+        pivot_row = rows[k]
+        pivot = pivot_row[k]
+        pivot_tail = pivot_row[k + 1:]
+        for i in range(k + 1, n):
+            row = rows[i]
+            factor = row[k]
+            row[k + 1:] = [(pivot * value - factor * pivot_value) // previous
+                           for value, pivot_value in zip(row[k + 1:], pivot_tail)]
+        previous = pivot
+    det = Fraction(sign * rows[-1][-1], scale)
+    return det.numerator if det.denominator == 1 else det
+
+
+MODULUS_LIMIT = 1 << 62
+MILLER_RABIN_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+worker_rows = None
+
+
+def is_word_prime(n):
+    if n < 2 or n % 2 == 0:
+        return n == 2
+    odd_part = n - 1
+    shift = (odd_part & -odd_part).bit_length() - 1
+    odd_part >>= shift
+    for base in MILLER_RABIN_BASES_64:
+        base %= n
+        if base == 0:
+            continue
+        x = pow(base, odd_part, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(shift - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def word_primes(bits):
+    # Largest primes below MODULUS_LIMIT, just enough of them for their product
+    # to exceed 2 ** bits.
+    primes = []
+    candidate = MODULUS_LIMIT - 1
+    while bits > 0:
+        if is_word_prime(candidate):
+            primes.append(candidate)
+            bits -= candidate.bit_length() - 1
+        candidate -= 2
+    return primes
+
+
+def determinant_mod(rows, prime):
+    rows = [[value % prime for value in row] for row in rows]
+    n = len(rows)
+    det = 1
+    for k in range(n):
+        swap = next((i for i in range(k, n) if rows[i][k]), None)
+        if swap is None:
+            return 0
+        if swap != k:
+            rows[k], rows[swap] = rows[swap], rows[k]
+            det = -det
+        pivot_row = rows[k]
+        det = det * pivot_row[k] % prime
+        inverse = pow(pivot_row[k], -1, prime)
+        pivot_tail = pivot_row[k + 1:]
+        for i in range(k + 1, n):
+            row = rows[i]
+            factor = row[k] * inverse % prime
+            if factor:
+                row[k + 1:] = [(value - factor * pivot_value) % prime
+                               for value, pivot_value in zip(row[k + 1:], pivot_tail)]
+    return det
+
+
+def init_modular_worker(rows):
+    global worker_rows
+    worker_rows = rows
+
+
+def worker_determinant_mod(prime):
+    return determinant_mod(worker_rows, prime)
+
+
+def modular_determinant(matrix, workers=None):
+    # Multi-modular determinant: det mod p for word-sized primes p, combined by
+    # the Chinese Remainder Theorem once the product of the primes exceeds twice
+    # the Hadamard bound prod(|row|), which pins down the signed result.
+    rows, scale = integer_rows(matrix)
+    if not rows:
+        return 1
+    hadamard_bits = sum((sum(value * value for value in row).bit_length() + 1) // 2 for row in rows) + 1
+    primes = word_primes(hadamard_bits + 1)
+    if workers == 1:
+        residues = map(determinant_mod, [rows] * len(primes), primes)
+        return combine_residues(residues, primes, scale)
+    with ProcessPoolExecutor(workers, initializer=init_modular_worker, initargs=(rows,)) as pool:
+        return combine_residues(pool.map(worker_determinant_mod, primes), primes, scale)
+
+
+def combine_residues(residues, primes, scale):
+    value = 0
+    modulus = 1
+    for residue, prime in zip(residues, primes):
+        value += modulus * ((residue - value) * pow(modulus, -1, prime) % prime)
+        modulus *= prime
+    if value > modulus // 2:
+        value -= modulus
+    det = Fraction(value, scale)
+    return det.numerator if det.denominator == 1 else det
+
+
+def laplace_determinant(matrix):
     n = len(matrix)
     if n == 1:
         return matrix[0][0]
@@ -69,7 +578,7 @@ def calculate_determinant(matrix):
     for i in range(n):
         submatrix = create_submatrix(matrix, 0, i)
         cofactor = (-1) ** i * matrix[0][i]
-        det += cofactor * calculate_determinant(submatrix)
+        det += cofactor * laplace_determinant(submatrix)
     return det
 
 
@@ -80,16 +589,82 @@ def create_submatrix(matrix, row_to_remove, col_to_remove):
     ]
 
 
-def get_matrix_input(matrix_str):
+def parse_exact(text):
+    try:
+        return int(text)
+    except ValueError:
+        return Fraction(text.strip())
+
+
+def get_matrix_input(matrix_str, exact=False):
     rows = matrix_str.strip().split('\n')
-    return [list(map(float, row.split(','))) for row in rows]
+    return [list(map(parse_exact if exact else float, row.split(','))) for row in rows]
+
+
+NPY_MAGIC = b'\x93NUMPY'
+NPY_TYPECODES = {'f8': 'd', 'f4': 'f', 'i8': 'q', 'i4': 'i'}
+
+
+def load_matrix_file(path):
+    # Streams a square matrix from a .npy file or a comma separated text file
+    # into one flat array('d'); returns the buffer and the dimension.
+    with open(path, 'rb') as matrix_file:
+        if matrix_file.read(len(NPY_MAGIC)) == NPY_MAGIC:
+            return read_npy_matrix(matrix_file)
+    buffer = array('d')
+    n = None
+    rows = 0
+    with open(path) as matrix_file:
+        for line in matrix_file:
+            if not line.strip():
+                continue
+            start = len(buffer)
+            buffer.extend(map(float, line.split(',')))
+            if n is None:
+                n = len(buffer)
+            rows += 1
+            if len(buffer) - start != n or rows > n:
+                raise ValueError("The matrix must be square.")
+    if rows != n:
+        raise ValueError("The matrix must be square.")
+    return buffer, n
+
+
+def read_npy_matrix(matrix_file):
+    major = matrix_file.read(2)[0]
+    header_size = struct.unpack('<H' if major == 1 else '<I', matrix_file.read(2 if major == 1 else 4))[0]
+    header = ast.literal_eval(matrix_file.read(header_size).decode('latin1'))
+    shape = header['shape']
+    if len(shape) != 2 or shape[0] != shape[1]:
+        raise ValueError("The matrix must be square.")
+    byte_order, kind = header['descr'][0], header['descr'][1:]
+    if kind not in NPY_TYPECODES:
+        raise ValueError(f"Unsupported .npy dtype: {header['descr']}")
+    n = shape[0]
+    values = array(NPY_TYPECODES[kind])
+    values.fromfile(matrix_file, n * n)
+    if {'<': 'little', '>': 'big'}.get(byte_order, sys.byteorder) != sys.byteorder:
+        values.byteswap()
+    # A Fortran-ordered file holds the transpose, which has the same determinant.
+    return values if values.typecode == 'd' else array('d', values), n
+
+
+def determinant_from_file(path):
+    # Factorises the loaded array('d') in place rather than copying it into a
+    # list of n * n Python floats.
+    buffer, n = load_matrix_file(path)
+    sign, pivots = factor_blocks(buffer, n, LU_BLOCK_SIZE, None, 1)
+    return sign * math.prod(pivots)
 
 
 def run_determinant():
     try:
         matrix_string = matrix_entry.get("1.0", tk.END)
-        matrix = get_matrix_input(matrix_string)
-        determinant = calculate_determinant(matrix)
+        matrix = get_matrix_input(matrix_string, exact=True)
+        if all(isinstance(value, int) for row in matrix for value in row):
+            determinant = calculate_determinant(matrix, method='bareiss')
+        else:
+            determinant = calculate_determinant(get_matrix_input(matrix_string))
         result_label.config(text=f"Determinant: {determinant}")
     except ValueError:
         result_label.config(text="Invalid data. Enter only numbers.")
@@ -97,43 +672,6 @@ def run_determinant():
         result_label.config(text=f"ERROR: {e}")
 
 
-window = tk.Tk()
-window.title("Determinant of the Matrix")
-window.geometry("800x500")
-
-configure_style(window)
-
-
-main_frame = ttk.Frame(window)
-main_frame.pack(padx=20, pady=20, fill=tk.BOTH, expand=True)
-
-
-matrix_frame = ttk.LabelFrame(
-    main_frame,
-    text="Enter matrix (comma separated values, new lines on new lines)"
-)
-matrix_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-
-matrix_entry = tk.Text(
-    matrix_frame,
-    height=6,
-    bg='#252526',
-    fg='#FFFFFF',
-    insertbackground='#FFFFFF',
-    padx=10,
-    pady=10,
-    wrap=tk.WORD,
-    font=('Consolas', 10),
-    relief='flat',
-    highlightthickness=0,
-    borderwidth=0
-)
-matrix_entry.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
-
-button_frame = tk.Frame(main_frame, bg='#121212')
-button_frame.pack(fill=tk.X, pady=5)
-
-
 class RoundedButton(tk.Canvas):
     def __init__(self, parent, text, command, width=120, height=40,
                  corner_radius=10, bg='#2D2D2D', fg='white', hover_bg='#3D3D3D',
@@ -191,28 +729,67 @@ class RoundedButton(tk.Canvas):
         if self.command:
             self.command()
 
-calc_button = RoundedButton(
-    button_frame,
-    text="Calculate Determinant",
-    command=run_determinant,
-    width=180,
-    height=36,
-    corner_radius=18,
-    bg='#2D2D2D',
-    hover_bg='#3D3D3D'
-)
-calc_button.pack(pady=5)
-
-result_label = tk.Label(
-    main_frame,
-    text=" Result: ",
-    font=('Segoe UI', 11, 'bold'),
-    anchor='center',
-    bg='#121212',
-    fg='#FFFFFF',
-    bd=0,
-    highlightthickness=0
-)
-result_label.pack(fill=tk.X, pady=10)
-
-window.mainloop()
+
+if __name__ == "__main__":
+    window = tk.Tk()
+    window.title("Determinant of the Matrix")
+    window.geometry("800x500")
+
+    configure_style(window)
+
+
+    main_frame = ttk.Frame(window)
+    main_frame.pack(padx=20, pady=20, fill=tk.BOTH, expand=True)
+
+
+    matrix_frame = ttk.LabelFrame(
+        main_frame,
+        text="Enter matrix (comma separated values, new lines on new lines)"
+    )
+    matrix_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+
+    matrix_entry = tk.Text(
+        matrix_frame,
+        height=6,
+        bg='#252526',
+        fg='#FFFFFF',
+        insertbackground='#FFFFFF',
+        padx=10,
+        pady=10,
+        wrap=tk.WORD,
+        font=('Consolas', 10),
+        relief='flat',
+        highlightthickness=0,
+        borderwidth=0
+    )
+    matrix_entry.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+
+    button_frame = tk.Frame(main_frame, bg='#121212')
+    button_frame.pack(fill=tk.X, pady=5)
+
+
+    calc_button = RoundedButton(
+        button_frame,
+        text="Calculate Determinant",
+        command=run_determinant,
+        width=180,
+        height=36,
+        corner_radius=18,
+        bg='#2D2D2D',
+        hover_bg='#3D3D3D'
+    )
+    calc_button.pack(pady=5)
+
+    result_label = tk.Label(
+        main_frame,
+        text=" Result: ",
+        font=('Segoe UI', 11, 'bold'),
+        anchor='center',
+        bg='#121212',
+        fg='#FFFFFF',
+        bd=0,
+        highlightthickness=0
+    )
+    result_label.pack(fill=tk.X, pady=10)
+
+    window.mainloop()
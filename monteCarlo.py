@@ -1,7 +1,15 @@
 import tkinter as tk
 from tkinter import ttk
+import hashlib
 import math
+import operator
+import os
 import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from statistics import NormalDist, stdev
 
 
 def configure_style(window):
@@ -39,15 +47,377 @@ def f(x):
     return abs(math.sin(x) + math.sin(2 * x) + math.sin(4 * x) + math.sin(8 * x))
 
 
-def calculate_surface_monte_carlo(num_samples=1000000, a=0, b=2 * math.pi, h=4):
-    points_under_curve = 0
-    for _ in range(num_samples):
-        x = a + random.random() * (b - a)
-        y = random.random() * h
-        if y < f(x):
-            points_under_curve += 1
-    area = (b - a) * h
-    return (area * points_under_curve) / num_samples
+MC_CHUNK_SIZE = 1 << 16
+FREQUENCIES = (1, 2, 4, 8)
+
+
+def chunk_sizes(num_samples, chunk_size=MC_CHUNK_SIZE):
+    full, rest = divmod(num_samples, chunk_size)
+    sizes = [chunk_size] * full
+    if rest:
+        sizes.append(rest)
+    return sizes
+
+
+def chunk_seed(seed, index):
+    # Every chunk gets its own stream derived from the run seed and the chunk
+    # index alone, so the result does not depend on which process draws it.
+    digest = hashlib.sha256(f"{seed}:{index}".encode()).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def f_squared_integral(a, b):
+    # Closed form of the integral of f(x)^2 = (sum of sin(k x))^2 over [a, b].
+    def antiderivative(x):
+        total = 0.0
+        for i, j in enumerate(FREQUENCIES):
+            total += x / 2 - math.sin(2 * j * x) / (4 * j)
+            for k in FREQUENCIES[i + 1:]:
+                total += math.sin((k - j) * x) / (k - j) - math.sin((k + j) * x) / (k + j)
+        return total
+    return antiderivative(b) - antiderivative(a)
+
+
+def sum_and_variance(values):
+    # Returns the sum of independent per-unit estimates together with the
+    # estimated variance of that sum.
+    count = len(values)
+    total = math.fsum(values)
+    if count < 2:
+        return total, 0.0
+    mean = total / count
+    return total, count * math.fsum((value - mean) ** 2 for value in values) / (count - 1)
+
+
+def random_draw(generator):
+    # Pseudo-random counterpart of quasi_draw: every call returns the next
+    # count uniforms of one stream, whatever the dimension.
+    uniform = generator.random
+
+    def draw(count, dimension):
+        return [uniform() for _ in repeat(None, count)]
+    return draw
+
+
+HIT_TABLE_CELLS = 1 << 12
+F_LIPSCHITZ = sum(FREQUENCIES)
+
+
+@lru_cache(maxsize=8)
+def hit_bounds(a, b, h):
+    # Lower and upper bounds of f on each of HIT_TABLE_CELLS equal cells of
+    # [a, b], from f at the cell centre and its Lipschitz constant. Cells where
+    # f may exceed h get no lower bound, so their samples are checked exactly.
+    width = (b - a) / HIT_TABLE_CELLS
+    margin = F_LIPSCHITZ * abs(width) / 2 + 1e-9
+    centres = [f(a + (cell + 0.5) * width) for cell in range(HIT_TABLE_CELLS)]
+    lower = [value - margin if value + margin <= h else -math.inf for value in centres]
+    upper = [value + margin for value in centres]
+    return lower, upper
+
+
+def hit_or_miss_chunk(draw, size, a, b, h):
+    # Most points are decided by the bounds of f on their cell alone; f itself
+    # is evaluated only when y falls between the bounds, which gives the same
+    # hits as comparing y with f(x) at every point for a fraction of the cost.
+    width = b - a
+    lower, upper = hit_bounds(a, b, h)
+    cells = HIT_TABLE_CELLS
+    hits = 0
+    for u, v in zip(draw(size, 0), draw(size, 1)):
+        cell = int(u * cells)
+        y = v * h
+        if y < lower[cell]:
+            hits += 1
+        elif y < upper[cell]:
+            height = f(a + u * width)
+            if height > h:
+                raise ValueError(f"h = {h} is below the maximum of f on [a, b]")
+            hits += y < height
+    area = width * h
+    if size < 2:
+        return area * hits, 0.0
+    return area * hits, area * area * hits * (size - hits) / (size - 1)
+
+
+def mean_chunk(draw, size, a, b, h):
+    width = b - a
+    return sum_and_variance([width * f(a + u * width) for u in draw(size, 0)])
+
+
+def antithetic_chunk(draw, size, a, b, h):
+    # Pairs x with its mirror a + b - x; each pair average is one unit, and the
+    # chunk total is scaled back to size samples.
+    width = b - a
+    pairs = max(1, size // 2)
+    units = [width * (f(a + u * width) + f(b - u * width)) / 2 for u in draw(pairs, 0)]
+    total, variance = sum_and_variance(units)
+    scale = size / pairs
+    return total * scale, variance * scale * scale
+
+
+def stratified_chunk(draw, size, a, b, h):
+    # Splits [a, b] into size // 2 equal strata with at least two samples
+    # each, so the variance within every stratum can be estimated.
+    width = b - a
+    strata = max(1, size // 2)
+    stratum_width = width / strata
+    values = [width * f(a + (i % strata + u) * stratum_width) for i, u in enumerate(draw(size, 0))]
+    total = variance = 0.0
+    for stratum in range(strata):
+        group = values[stratum::strata]
+        group_total, group_variance = sum_and_variance(group)
+        count = len(group)
+        # Every stratum carries 1 / strata of the estimate whatever its count.
+        weight = size / (strata * count)
+        total += weight * group_total
+        variance += weight * weight * group_variance
+    return total, variance
+
+
+def control_variate_chunk(draw, size, a, b, h):
+    # Uses f(x)^2, whose integral is known in closed form, as a control
+    # variate; the coefficient is the least-squares fit within the chunk.
+    width = b - a
+    heights = [f(a + u * width) for u in draw(size, 0)]
+    values = [width * height for height in heights]
+    controls = [width * height * height for height in heights]
+    value_mean = math.fsum(values) / size
+    control_mean = math.fsum(controls) / size
+    spread = math.fsum((control - control_mean) ** 2 for control in controls)
+    covariance = math.fsum((value - value_mean) * (control - control_mean)
+                           for value, control in zip(values, controls))
+    beta = covariance / spread if spread else 0.0
+    expected = f_squared_integral(a, b)
+    return sum_and_variance([value - beta * (control - expected) for value, control in zip(values, controls)])
+
+
+ESTIMATORS = {
+    'hit_or_miss': hit_or_miss_chunk,
+    'mean': mean_chunk,
+    'stratified': stratified_chunk,
+    'antithetic': antithetic_chunk,
+    'control_variate': control_variate_chunk,
+}
+
+
+def estimate_chunk(task):
+    seed, index, size, a, b, h, estimator = task
+    return ESTIMATORS[estimator](random_draw(random.Random(chunk_seed(seed, index))), size, a, b, h)
+
+
+def chunk_tasks(seed, sizes, start, a, b, h, estimator):
+    if estimator not in ESTIMATORS:
+        raise ValueError(f"Unknown estimator: {estimator}")
+    return [(seed, index, size, a, b, h, estimator) for index, size in enumerate(sizes, start)]
+
+
+def estimate_chunks(tasks, pool=None, workers=1):
+    # Chunk results come back in task order, so the floating-point sums are
+    # the same however many workers computed them.
+    if pool is None:
+        return list(map(estimate_chunk, tasks))
+    return list(pool.map(estimate_chunk, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+
+
+def calculate_surface_monte_carlo(num_samples=1000000, a=0, b=2 * math.pi, h=4, seed=None,
+                                  chunk_size=MC_CHUNK_SIZE, workers=1, estimator='hit_or_miss', sampling='random'):
+    # A given seed, chunk_size and estimator give the same result for any
+    # number of workers. Only hit_or_miss uses h. sampling may also name a
+    # sequence in QMC_SEQUENCES for a single randomized quasi-random pass.
+    if sampling != 'random':
+        return quasi_replica_estimates(num_samples, a, b, h, sampling, 1, seed, chunk_size, workers, estimator)[0]
+    if num_samples < 1:
+        raise ValueError("num_samples must be positive")
+    if seed is None:
+        seed = random.getrandbits(64)
+    tasks = chunk_tasks(seed, chunk_sizes(num_samples, chunk_size), 0, a, b, h, estimator)
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        results = estimate_chunks(tasks)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = estimate_chunks(tasks, pool, workers)
+    return math.fsum(total for total, _ in results) / num_samples
+
+
+MonteCarloResult = namedtuple('MonteCarloResult', 'estimate stderr low high samples')
+ADAPTIVE_ROUND_CHUNKS = 8
+
+
+def adaptive_surface_monte_carlo(max_samples=100000000, a=0, b=2 * math.pi, h=4, abs_tol=0.0, rel_tol=1e-3,
+                                 confidence=0.95, seed=None, chunk_size=MC_CHUNK_SIZE, workers=1,
+                                 estimator='hit_or_miss'):
+    # Draws rounds of ADAPTIVE_ROUND_CHUNKS chunks and stops once the
+    # confidence half-width is within max(abs_tol, rel_tol * |estimate|).
+    # Chunks are seeded exactly as in calculate_surface_monte_carlo, and the
+    # stopping test only runs between rounds, so results are reproducible
+    # for any number of workers.
+    if max_samples < 1:
+        raise ValueError("max_samples must be positive")
+    if abs_tol <= 0 and rel_tol <= 0:
+        raise ValueError("abs_tol or rel_tol must be positive")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if seed is None:
+        seed = random.getrandbits(64)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    sizes = chunk_sizes(max_samples, chunk_size)
+    workers = workers or os.cpu_count()
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    results = []
+    samples = 0
+    try:
+        for start in range(0, len(sizes), ADAPTIVE_ROUND_CHUNKS):
+            round_sizes = sizes[start:start + ADAPTIVE_ROUND_CHUNKS]
+            results += estimate_chunks(chunk_tasks(seed, round_sizes, start, a, b, h, estimator), pool, workers)
+            samples += sum(round_sizes)
+            estimate = math.fsum(total for total, _ in results) / samples
+            stderr = math.sqrt(math.fsum(variance for _, variance in results)) / samples
+            # A zero sample variance (every sample hit, say) says nothing about
+            # the error, so it never ends the run early.
+            if 0 < z * stderr <= max(abs_tol, rel_tol * abs(estimate)):
+                break
+    finally:
+        if pool:
+            pool.shutdown()
+    return MonteCarloResult(estimate, stderr, estimate - z * stderr, estimate + z * stderr, samples)
+
+
+HALTON_BASES = (2, 3)
+SOBOL_BITS = 32
+
+
+def sobol_directions(bits=SOBOL_BITS):
+    # Direction numbers for the first two Sobol dimensions: the van der Corput
+    # sequence, and the primitive polynomial x + 1 with m_k = m_(k-1) ^ 2 m_(k-1).
+    first = [1 << (bits - 1 - k) for k in range(bits)]
+    second = []
+    m = 1
+    for k in range(bits):
+        second.append(m << (bits - 1 - k))
+        m ^= m << 1
+    return first, second
+
+
+SOBOL_DIRECTIONS = sobol_directions()
+
+
+def halton_points(start, count, dimension, shift):
+    # Radical inverses of start, ..., start + count - 1 in the dimension's base,
+    # counting up in reversed digits so each point costs amortized O(1)
+    # exact integer steps. shift is a Cranley-Patterson rotation.
+    base = HALTON_BASES[dimension]
+    places = 1
+    while base ** places <= start + count:
+        places += 1
+    scale = base ** places
+    weights = [base ** (places - 1 - k) for k in range(places)]
+    digits = []
+    index = start
+    for _ in range(places):
+        index, digit = divmod(index, base)
+        digits.append(digit)
+    numerator = sum(digit * weight for digit, weight in zip(digits, weights))
+    points = []
+    for _ in repeat(None, count):
+        points.append((numerator / scale + shift) % 1.0)
+        k = 0
+        while digits[k] == base - 1:
+            digits[k] = 0
+            numerator -= (base - 1) * weights[k]
+            k += 1
+        digits[k] += 1
+        numerator += weights[k]
+    return points
+
+
+def sobol_points(start, count, dimension, shift):
+    # Gray-code Sobol points: consecutive indices differ by one direction
+    # number, chosen by the lowest zero bit. shift is a random digital shift
+    # XORed into every point.
+    if start + count > 1 << SOBOL_BITS:
+        raise ValueError(f"Sobol sampling supports at most 2**{SOBOL_BITS} points")
+    directions = SOBOL_DIRECTIONS[dimension]
+    gray = start ^ (start >> 1)
+    x = 0
+    for direction in directions:
+        if gray & 1:
+            x ^= direction
+        gray >>= 1
+    scale = 1 / (1 << SOBOL_BITS)
+    points = []
+    for index in range(start + 1, start + count + 1):
+        points.append((x ^ shift) * scale)
+        x ^= directions[(index & -index).bit_length() - 1]
+    return points
+
+
+QMC_SEQUENCES = {
+    'halton': (halton_points, lambda generator: generator.random()),
+    'sobol': (sobol_points, lambda generator: generator.getrandbits(SOBOL_BITS)),
+}
+QMC_ESTIMATORS = ('hit_or_miss', 'mean')
+
+
+def quasi_draw(sequence, generator, start):
+    # Every replica draws one randomization per dimension from its own
+    # generator and then walks the same points, chunk by chunk from start.
+    points, make_shift = QMC_SEQUENCES[sequence]
+    shifts = [make_shift(generator) for _ in HALTON_BASES]
+
+    def draw(count, dimension):
+        return points(start, count, dimension, shifts[dimension])
+    return draw
+
+
+def estimate_quasi_chunk(task):
+    seed, replica, start, size, a, b, h, estimator, sequence = task
+    draw = quasi_draw(sequence, random.Random(chunk_seed(seed, replica)), start)
+    total, _ = ESTIMATORS[estimator](draw, size, a, b, h)
+    return total
+
+
+def quasi_replica_estimates(num_samples, a, b, h, sequence, replicas, seed, chunk_size, workers, estimator):
+    if sequence not in QMC_SEQUENCES:
+        raise ValueError(f"Unknown sequence: {sequence}")
+    if estimator not in QMC_ESTIMATORS:
+        raise ValueError(f"Estimator {estimator} is not supported with quasi-random sampling")
+    if num_samples < 1 or replicas < 1:
+        raise ValueError("num_samples and replicas must be positive")
+    if seed is None:
+        seed = random.getrandbits(64)
+    sizes = chunk_sizes(num_samples, chunk_size)
+    starts = [0]
+    for size in sizes[:-1]:
+        starts.append(starts[-1] + size)
+    tasks = [(seed, replica, start, size, a, b, h, estimator, sequence)
+             for replica in range(replicas) for start, size in zip(starts, sizes)]
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        totals = list(map(estimate_quasi_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            totals = list(pool.map(estimate_quasi_chunk, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    return [math.fsum(totals[replica * len(sizes):(replica + 1) * len(sizes)]) / num_samples
+            for replica in range(replicas)]
+
+
+def quasi_surface_monte_carlo(num_samples=65536, a=0, b=2 * math.pi, h=4, sequence='sobol', replicas=16,
+                              confidence=0.95, seed=None, chunk_size=MC_CHUNK_SIZE, workers=1, estimator='mean'):
+    # Randomized QMC: the replicas are independent randomizations of the same
+    # num_samples points, so their spread gives the standard error. The
+    # interval uses the normal quantile, which is optimistic for few replicas.
+    if replicas < 2:
+        raise ValueError("At least two replicas are needed for an error estimate")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    estimates = quasi_replica_estimates(num_samples, a, b, h, sequence, replicas, seed, chunk_size, workers,
+                                        estimator)
+    estimate = math.fsum(estimates) / replicas
+    stderr = stdev(estimates) / math.sqrt(replicas)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    return MonteCarloResult(estimate, stderr, estimate - z * stderr, estimate + z * stderr, num_samples * replicas)
 
 
 class RoundedButton(tk.Canvas):
@@ -229,11 +599,14 @@ class MonteCarloSurfaceCalculator:
             a = float(self.param_entries["Start (a)"].get())
             b = float(self.param_entries["End (b)"].get())
             h = float(self.param_entries["Height (h)"].get())
-
-            surface_area = calculate_surface_monte_carlo(num_samples, a, b, h)
-            self.result_label.config(text=f"Surface Area: {surface_area:.6f}")
         except ValueError:
             self.result_label.config(text="Invalid input. Please enter numeric values.")
+            return
+        try:
+            surface_area = calculate_surface_monte_carlo(num_samples, a, b, h)
+            self.result_label.config(text=f"Surface Area: {surface_area:.6f}")
+        except ValueError as e:
+            self.result_label.config(text=f"ERROR: {e}")
 
     def reset_parameters(self):
         defaults = {
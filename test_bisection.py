@@ -0,0 +1,31 @@
+import pytest
+
+from Bisection import find_roots, find_roots_bisection
+
+
+def test_root_at_lower_bound():
+    assert find_roots([1, -1, 0], 0, 2) == [0.0, 1.0]
+
+
+def test_root_at_upper_bound():
+    assert find_roots([1, -1, 0], -1, 1) == [0.0, 1.0]
+
+
+def test_roots_at_both_bounds():
+    for method in ('bisection', 'illinois', 'brent', 'newton'):
+        assert find_roots([1, -3, 2], 1, 2, method=method) == [1.0, 2.0]
+
+
+def test_illinois_first_step_next_to_left_end():
+    assert find_roots([1, 0, 0, -0.001], 0, 100, method='illinois') == [0.1]
+
+
+def test_reversed_bounds():
+    assert find_roots([1, 0, -1], 2, -2) == []
+    assert find_roots_bisection(0, 0, 0, 0, 1, -1, min_val=5, max_val=-5) == []
+
+
+def test_infinite_bound_raises_value_error():
+    with pytest.raises(ValueError):
+        find_roots([1e-320, 1, -1])
+    assert find_roots([1e-320, 1, -1], -10, 10) == [1.0]
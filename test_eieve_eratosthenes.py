@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+from EieveEratosthenes import PrimeTable, prime_pi
+
+
+def run_python(code, timeout=60):
+    return subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)), timeout=timeout, check=True)
+
+
+def test_extend_open_table_twice(tmp_path):
+    path = tmp_path / 'primes.tbl'
+    # Runs in a child process so that a lock regression fails the test
+    # instead of hanging the run.
+    run_python(f"""
+from EieveEratosthenes import PrimeTable
+table = PrimeTable({str(path)!r}, 100)
+table.extend(5000)
+table.extend(20000)
+assert table.count_in_range(0, 20001) == 2262
+""")
+
+
+def test_extend_while_another_process_holds_table(tmp_path):
+    path = str(tmp_path / 'primes.tbl')
+    table = PrimeTable(path, 1000)
+    assert table.is_prime(997)
+    run_python(f"""
+from EieveEratosthenes import PrimeTable
+PrimeTable({path!r}).extend(100000)
+""")
+    assert table.count_in_range(0, 100001) == prime_pi(100000)
+    table.close()